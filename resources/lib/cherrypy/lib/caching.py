@@ -39,7 +39,7 @@ import time
 
 import cherrypy
 from cherrypy.lib import cptools, httputil
-from cherrypy._cpcompat import copyitems, ntob, set_daemon, sorted, Event
+from cherrypy._cpcompat import copyitems, ntob, set_daemon, Event
 
 
 class Cache(object):
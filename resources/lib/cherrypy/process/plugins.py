@@ -8,7 +8,7 @@ import time
 import threading
 
 from cherrypy._cpcompat import text_or_bytes, get_daemon, get_thread_ident
-from cherrypy._cpcompat import ntob, Timer, SetDaemonProperty
+from cherrypy._cpcompat import ntob, Timer
 
 # _module__file__base is used by Autoreload to make
 # absolute any filenames retrieved from sys.modules which are not
@@ -487,7 +487,7 @@ class PerpetualTimer(Timer):
                 raise
 
 
-class BackgroundTask(SetDaemonProperty, threading.Thread):
+class BackgroundTask(threading.Thread):
 
     """A subclass of threading.Thread whose run() method repeats.
 
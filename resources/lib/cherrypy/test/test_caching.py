@@ -9,7 +9,7 @@ import time
 import urllib
 
 import cherrypy
-from cherrypy._cpcompat import next, ntob, quote, xrange
+from cherrypy._cpcompat import ntob, quote
 from cherrypy.lib import httputil
 
 gif_bytes = ntob(
@@ -308,7 +308,7 @@ class CacheTest(helper.CPWebCase):
             self.getPage("/long_process?seconds=%d" % SECONDS)
             # The response should be the same every time
             self.assertBody('success!')
-        ts = [threading.Thread(target=run) for i in xrange(100)]
+        ts = [threading.Thread(target=run) for i in range(100)]
         for t in ts:
             t.start()
         for t in ts:
@@ -19,3 +19,17 @@ class StringTester(unittest.TestCase):
         if six.PY3:
             raise nose.SkipTest("Only useful on Python 2")
         self.assertRaises(Exception, compat.ntob, unicode('fight'))
+
+    def test_ntob_many(self):
+        self.assertEqual(compat.ntob_many(['a', '\xe9']), [b'a', b'\xe9'])
+        self.assertEqual(compat.ntob_many(['\xe9'], 'utf-8'), [b'\xc3\xa9'])
+
+    def test_headers_to_native(self):
+        pairs = [(b'Content-Type', b'text/plain'), (b'X-Name', b'\xe9')]
+        self.assertEqual(compat.headers_to_native(pairs),
+                         [('Content-Type', 'text/plain'), ('X-Name', '\xe9')])
+
+    def test_base64_decode_whitespace(self):
+        self.assertEqual(compat.base64_decode('Zm9vOmJhcg=='), 'foo:bar')
+        self.assertEqual(compat.base64_decode('Zm9v\r\n OmJh\tcg==\n'),
+                         'foo:bar')
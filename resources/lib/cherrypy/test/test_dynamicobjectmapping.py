@@ -1,7 +1,6 @@
 import six
 
 import cherrypy
-from cherrypy._cpcompat import sorted
 from cherrypy.test import helper
 
 script_names = ["", "/foo", "/users/fred/blog", "/corp/blog"]
@@ -39,6 +39,11 @@ class JsonTest(helper.CPWebCase):
                 else:
                     return 'nok'
 
+            @cherrypy.expose
+            @json_in
+            def json_repr(self):
+                return repr(cherrypy.request.json)
+
             @cherrypy.expose
             @json_out
             @cherrypy.config(**{'tools.caching.on': True})
@@ -89,6 +94,31 @@ class JsonTest(helper.CPWebCase):
         self.getPage("/json_post", method="POST", headers=headers, body=body)
         self.assertStatus(400, 'Invalid JSON document')
 
+    def test_json_input_number_edge_cases(self):
+        # Valid documents must decode exactly: no precision loss on big
+        # integers, and NaN/Infinity and lone surrogates are accepted.
+        if json is None:
+            self.skip("json not found ")
+            return
+
+        body = '[123456789012345678901234567890]'
+        headers = [('Content-Type', 'application/json'),
+                   ('Content-Length', str(len(body)))]
+        self.getPage("/json_repr", method="POST", headers=headers, body=body)
+        self.assertBody('[123456789012345678901234567890]')
+
+        body = '[NaN, Infinity, 1e400]'
+        headers = [('Content-Type', 'application/json'),
+                   ('Content-Length', str(len(body)))]
+        self.getPage("/json_repr", method="POST", headers=headers, body=body)
+        self.assertBody('[nan, inf, inf]')
+
+        body = '["\\ud800"]'
+        headers = [('Content-Type', 'application/json'),
+                   ('Content-Length', str(len(body)))]
+        self.getPage("/json_repr", method="POST", headers=headers, body=body)
+        self.assertBody("['\\ud800']")
+
     def test_cached(self):
         if json is None:
             self.skip("json not found ")
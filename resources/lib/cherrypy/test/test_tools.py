@@ -6,7 +6,7 @@ import unittest
 import io
 
 from cherrypy._cpcompat import copyitems, itervalues
-from cherrypy._cpcompat import IncompleteRead, ntob, ntou, xrange
+from cherrypy._cpcompat import IncompleteRead, ntob, ntou
 import time
 timeout = 0.2
 import types
@@ -212,7 +212,7 @@ class ToolTests(helper.CPWebCase):
 
             @cherrypy.config(**{'response.stream': True})
             def stream(self, id=None):
-                for x in xrange(100000000):
+                for x in range(100000000):
                     yield str(x)
 
         conf = {
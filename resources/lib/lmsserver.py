@@ -9,8 +9,7 @@
 '''
 
 import xbmc
-from utils import log_msg, log_exception, json, process_method_on_list
-import requests
+from utils import log_exception, process_method_on_list, json_rpc
 import socket
 import threading
 import re
@@ -224,14 +223,9 @@ class LMSServer:
         '''get info from json api'''
         result = {}
         try:
-            response = requests.post(url, data=json.dumps(params), timeout=20)
-            if response and response.content and response.status_code == 200:
-                result = json.loads(response.content.decode('utf-8', 'replace'))
-                if "result" in result:
-                    result = result["result"]
-            else:
-                log_msg("Invalid or empty response from server - command: %s - server response: %s" %
-                        (cmd, response.status_code))
+            result = json_rpc(url, params)
+            if "result" in result:
+                result = result["result"]
         except Exception:
             log_exception(__name__, "Server is offline or connection error...")
 
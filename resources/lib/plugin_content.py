@@ -12,7 +12,7 @@ import xbmc
 import xbmcplugin
 import xbmcgui
 import xbmcaddon
-from utils import log_msg, KODI_VERSION, log_exception, ADDON_ID, parse_duration
+from utils import log_msg, log_exception, ADDON_ID, parse_duration
 import urllib.parse as urlparse
 from urllib.parse import quote_plus
 import sys
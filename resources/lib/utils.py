@@ -15,8 +15,8 @@ import subprocess
 import os
 import stat
 import sys
-import urllib
-from traceback import format_exc
+import time
+import traceback
 import requests
 
 try:
@@ -24,10 +24,21 @@ try:
 except Exception:
     import json
 
+try:
+    # orjson works on bytes directly and is a lot faster, use it when available
+    from orjson import loads as json_loads, dumps as json_dumps
+except ImportError:
+    json_loads = json.loads
+    json_dumps = json.dumps
+
 
 ADDON_ID = "plugin.audio.squeezebox"
-KODI_VERSION = int(xbmc.getInfoLabel("System.BuildVersion").split(".")[0])
-KODILANGUAGE = xbmc.getLanguage(xbmc.ISO_639_1)
+_LOG_PREFIX = ADDON_ID + " --> "
+
+# one shared session so calls to the LMS server reuse keep-alive connections
+SESSION = requests.Session()
+_adapter = requests.adapters.HTTPAdapter(pool_connections=2, pool_maxsize=4, max_retries=0)
+SESSION.mount("http://", _adapter)
 
 try:
     from multiprocessing.pool import ThreadPool
@@ -38,24 +49,61 @@ except Exception:
 
 def log_msg(msg, loglevel=xbmc.LOGINFO):
     '''log message to kodi log'''
-    xbmc.log("%s --> %s" % (ADDON_ID, msg), level=loglevel)
+    if isinstance(msg, bytes):
+        msg = msg.decode("utf-8", "replace")
+    elif not isinstance(msg, str):
+        msg = str(msg)
+    xbmc.log(_LOG_PREFIX + msg, level=loglevel)
 
 
 def log_exception(modulename, exceptiondetails):
     '''helper to properly log an exception'''
-    log_msg("Exception in %s ! --> %s" % (modulename, exceptiondetails), xbmc.LOGWARNING)
+    exc_info = sys.exc_info()
+    if exc_info[0] is not None:
+        tbe = traceback.TracebackException(*exc_info)
+        log_msg("".join(tbe.format()), xbmc.LOGWARNING)
+    log_msg("Exception in %s ! --> %s" % (modulename, exceptiondetails), xbmc.LOGERROR)
+
+
+def http_get(url, **kwargs):
+    '''GET an url using the shared http session'''
+    return SESSION.get(url, **kwargs)
+
+
+def http_post(url, **kwargs):
+    '''POST to an url using the shared http session'''
+    return SESSION.post(url, **kwargs)
+
+
+def json_rpc(url, payload, timeout=20):
+    '''post a json payload using the shared http session and return the decoded response'''
+    response = http_post(url, data=json_dumps(payload), timeout=timeout)
+    response.raise_for_status()
+    # decode the raw bytes, response.json()/.text would first sniff the encoding
+    try:
+        return json_loads(response.content)
+    except ValueError:
+        # lms can return badly encoded metadata (e.g. latin-1 tags),
+        # replace the invalid bytes rather than losing the whole response
+        return json_loads(response.content.decode("utf-8", "replace"))
 
 
 def get_mac():
     '''helper to obtain the mac address of the kodi machine'''
-    count = 0
     mac = ""
+    delay = 0.1
+    deadline = time.monotonic() + 360
     monitor = xbmc.Monitor()
-    while ":" not in mac and count < 360 and not monitor.abortRequested():
-        log_msg("Waiting for mac address...")
-        mac = xbmc.getInfoLabel("Network.MacAddress").lower()
-        count += 1
-        monitor.waitForAbort(1)
+    log_msg("Waiting for mac address...")
+    while time.monotonic() < deadline and not monitor.abortRequested():
+        raw = xbmc.getInfoLabel("Network.MacAddress")
+        # only lowercase once the label holds an actual address
+        if raw and ":" in raw:
+            mac = raw.lower()
+            break
+        # back off exponentially, the interface is usually up within seconds
+        monitor.waitForAbort(delay)
+        delay = min(delay * 1.5, 2.0)
     del monitor
     if not mac:
         log_msg("Mac detection failed!")
@@ -143,8 +191,7 @@ def process_method_on_list(method_to_run, items):
             all_items = pool.map(method_to_run, items)
         except Exception:
             # catch exception to prevent threadpool running forever
-            log_msg(format_exc(sys.exc_info()))
-            log_msg("Error in %s" % method_to_run)
+            log_exception(__name__, "Error in %s" % method_to_run)
         pool.close()
         pool.join()
     else:
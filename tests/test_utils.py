@@ -0,0 +1,85 @@
+import os
+import sys
+import types
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "resources", "lib"))
+
+# utils imports the kodi modules, which only exist inside kodi itself
+for _name in ("xbmc", "xbmcvfs", "xbmcaddon"):
+    if _name not in sys.modules:
+        sys.modules[_name] = types.ModuleType(_name)
+sys.modules["xbmc"].__dict__.setdefault("LOGINFO", 1)
+
+import utils
+
+
+class FakeResponse(object):
+
+    def __init__(self, content):
+        self.content = content
+
+    def raise_for_status(self):
+        pass
+
+
+class JsonRpcTest(unittest.TestCase):
+
+    def json_rpc(self, content):
+        with mock.patch.object(utils, "http_post", return_value=FakeResponse(content)):
+            return utils.json_rpc("http://lms:9000/jsonrpc.js", {"id": 1})
+
+    def test_valid_utf8(self):
+        result = self.json_rpc(b'{"result": {"title": "caf\xc3\xa9"}}')
+        self.assertEqual(result, {"result": {"title": u"caf\xe9"}})
+
+    def test_invalid_utf8_is_replaced(self):
+        result = self.json_rpc(b'{"result": {"title": "caf\xe9"}}')
+        self.assertEqual(result, {"result": {"title": u"caf\ufffd"}})
+
+    def test_invalid_json_raises(self):
+        self.assertRaises(ValueError, self.json_rpc, b'{"result": ')
+
+
+class FakeMonitor(object):
+
+    def abortRequested(self):
+        return False
+
+    def waitForAbort(self, timeout):
+        return False
+
+
+class GetMacTest(unittest.TestCase):
+
+    def get_mac(self, labels, clock, wall_clock=None):
+        xbmc = sys.modules["xbmc"]
+        with mock.patch.object(xbmc, "Monitor", FakeMonitor, create=True), \
+                mock.patch.object(xbmc, "getInfoLabel", side_effect=labels, create=True), \
+                mock.patch.object(xbmc, "log", create=True), \
+                mock.patch.object(utils.time, "monotonic", side_effect=clock), \
+                mock.patch.object(utils.time, "time", side_effect=wall_clock or clock):
+            return utils.get_mac()
+
+    def test_detects_mac_after_waiting(self):
+        labels = ["", "Busy", "", "AA:BB:CC:DD:EE:FF"]
+        clock = [0, 1, 2, 3, 4]
+        self.assertEqual(self.get_mac(labels, clock), "aa:bb:cc:dd:ee:ff")
+
+    def test_wall_clock_jump_does_not_end_polling(self):
+        # ntp syncing the clock while the network comes up must not matter,
+        # the deadline is taken from the monotonic clock only
+        labels = ["", "", "", "AA:BB:CC:DD:EE:FF"]
+        clock = [0, 1, 2, 3, 4]
+        wall_clock = [0, 1, 2, 86403, 86404]
+        self.assertEqual(self.get_mac(labels, clock, wall_clock), "aa:bb:cc:dd:ee:ff")
+
+    def test_gives_up_after_deadline(self):
+        labels = ["", ""]
+        clock = [0, 100, 361]
+        self.assertEqual(self.get_mac(labels, clock), "")
+
+
+if __name__ == "__main__":
+    unittest.main()